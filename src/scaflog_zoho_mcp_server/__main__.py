@@ -0,0 +1,5 @@
+# src_scaflog_zoho_mcp_server/__main__.py
+
+from . import main
+
+main()
@@ -1,5 +1,6 @@
 # src_scaflog_zoho_mcp_server/auth.py
 
+import asyncio
 import time
 from typing import Optional
 import httpx
@@ -24,11 +25,16 @@ class ZohoAuth:
         self.config = config
         self._token_info: Optional[TokenInfo] = None
         self._client = httpx.AsyncClient(timeout=30.0)
+        # Serializes token refreshes so concurrent callers share one refresh
+        self._refresh_lock = asyncio.Lock()
 
     async def get_access_token(self) -> str:
         """Get a valid access token, refreshing if necessary."""
         if not self._token_info or self._token_info.is_expired:
-            await self._refresh_token()
+            async with self._refresh_lock:
+                # Another caller may have refreshed while we waited for the lock
+                if not self._token_info or self._token_info.is_expired:
+                    await self._refresh_token()
         return self._token_info.access_token
 
     async def _refresh_token(self) -> None:
@@ -42,15 +48,14 @@ class ZohoAuth:
             "redirect_uri": "https://www.zohoapis.com"
         }
 
-        async with self._client as client:
-            response = await client.post(token_url, params=params)
-            response.raise_for_status()
-            data = response.json()
+        response = await self._client.post(token_url, params=params)
+        response.raise_for_status()
+        data = response.json()
 
-            self._token_info = TokenInfo(
-                access_token=data["access_token"],
-                expires_in=data["expires_in"]
-            )
+        self._token_info = TokenInfo(
+            access_token=data["access_token"],
+            expires_in=data["expires_in"]
+        )
 
     async def get_authorized_headers(self) -> dict:
         """Get headers with authorization token."""
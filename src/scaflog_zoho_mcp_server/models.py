@@ -1,6 +1,6 @@
 # src_scaflog_zoho_mcp_server/models.py
 
-from datetime import datetime
+import time
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 
@@ -39,22 +39,32 @@ class ZohoReport(BaseModel):
 
 class Cache:
     """Simple cache for form metadata."""
+    __slots__ = ('forms', 'reports', 'ttl', 'last_refresh', 'last_reports_refresh')
+
     def __init__(self, ttl_seconds: int = 300):
         self.forms: Dict[str, ZohoForm] = {}
         self.reports: Dict[str, ZohoReport] = {}
         self.ttl = ttl_seconds
-        self.last_refresh: Optional[datetime] = None
+        # time.monotonic() readings, immune to wall-clock adjustments
+        self.last_refresh: Optional[float] = None
+        self.last_reports_refresh: Optional[float] = None
 
     def needs_refresh(self) -> bool:
-        """Check if cache needs refreshing."""
-        if not self.last_refresh:
+        """Check if cached forms need refreshing."""
+        if self.last_refresh is None:
+            return True
+        return time.monotonic() - self.last_refresh > self.ttl
+
+    def needs_reports_refresh(self) -> bool:
+        """Check if cached reports need refreshing."""
+        if self.last_reports_refresh is None:
             return True
-        return (datetime.now() - self.last_refresh).total_seconds() > self.ttl
+        return time.monotonic() - self.last_reports_refresh > self.ttl
 
     def update_forms(self, forms: List[ZohoForm]):
         """Update cached forms."""
         self.forms = {form.link_name: form for form in forms}
-        self.last_refresh = datetime.now()
+        self.last_refresh = time.monotonic()
 
     def get_form(self, link_name: str) -> Optional[ZohoForm]:
         """Get a form from cache by link name."""
@@ -63,5 +73,9 @@ class Cache:
     def update_reports(self, reports: List[ZohoReport]):
         """Update cached reports."""
         self.reports = {report.link_name: report for report in reports}
-        self.last_refresh = datetime.now()
+        self.last_reports_refresh = time.monotonic()
+
+    def get_report(self, link_name: str) -> Optional[ZohoReport]:
+        """Get a report from cache by link name."""
+        return self.reports.get(link_name)
 
@@ -1,10 +1,11 @@
 # src_scaflog_zoho_mcp_server/server.py
 
-import json
 import logging
-from typing import Dict, List, Optional
+from functools import cache, lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from urllib.parse import parse_qs, urlparse
-from pydantic import AnyUrl
+import orjson
+from pydantic import AnyUrl, TypeAdapter, ValidationError
 
 from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
@@ -13,25 +14,74 @@ import mcp.server.stdio
 
 from .config import load_config, API_BASE_URL
 from .auth import ZohoAuth
+from .models import ZohoRecord
 from .service import ZohoCreatorService
-from .resource_config import WHITELISTED_RESOURCES
+from .resource_config import WHITELISTED_RESOURCES, FormConfig, ReportConfig
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# JSON serializers for the whitelist listings, built once at import time
+_FORMS_ADAPTER = TypeAdapter(Dict[str, List[FormConfig]])
+_REPORTS_ADAPTER = TypeAdapter(Dict[str, List[ReportConfig]])
+
+# Validators for tool arguments; the MCP server does not enforce inputSchema
+_FORM_NAME_ADAPTER = TypeAdapter(str)
+_RECORD_DATA_ADAPTER = TypeAdapter(Dict[str, Any])
+_RECORDS_DATA_ADAPTER = TypeAdapter(List[Dict[str, Any]])
+
+@lru_cache(maxsize=None)
+def _whitelist_json(resource_type: str) -> str:
+    """Serialize the whitelisted forms or reports listing once per process."""
+    adapter = _FORMS_ADAPTER if resource_type == "forms" else _REPORTS_ADAPTER
+    return adapter.dump_json({
+        resource_type: list(WHITELISTED_RESOURCES[resource_type].values())
+    }, indent=2).decode()
+
+@lru_cache(maxsize=None)
+def _config_json(resource_type: str, link_name: str) -> orjson.Fragment:
+    """Serialize a whitelisted form or report config once; it never changes at runtime."""
+    return orjson.Fragment(WHITELISTED_RESOURCES[resource_type][link_name].model_dump_json())
+
+def _config_block(resource_type: str, link_name: str, pretty: bool) -> Any:
+    """Get the config block of a form or report payload.
+
+    The cached fragment is immutable, but orjson embeds it verbatim, so
+    pretty-printed payloads get a freshly dumped dict instead.
+    """
+    if pretty:
+        return WHITELISTED_RESOURCES[resource_type][link_name].model_dump()
+    return _config_json(resource_type, link_name)
+
+@lru_cache(maxsize=512)
+def _parse_zoho_uri(uri_str: str) -> Tuple[str, Tuple[str, ...], bool]:
+    """Split a resource URI into its scheme, path parts and ?pretty=1 flag."""
+    parsed = urlparse(uri_str)
+    full_path = f"{parsed.netloc}{parsed.path}".strip("/")
+    pretty = parse_qs(parsed.query).get("pretty") == ["1"]
+    return parsed.scheme, tuple(full_path.split("/")), pretty
+
 # Create a server instance
 server = Server("scaflog-zoho-mcp-server")
-config = load_config()
-auth = ZohoAuth(config)
-service = ZohoCreatorService(auth)
+
+@cache
+def get_service() -> ZohoCreatorService:
+    """Create the Zoho Creator service on first use."""
+    return ZohoCreatorService(ZohoAuth(load_config()))
+
+# Resource listing built on the first list_resources call. It is derived
+# from WHITELISTED_RESOURCES only, so it stays valid for the process lifetime.
+_resources_snapshot: Optional[List[types.Resource]] = None
 
 @server.list_resources()
 async def handle_list_resources() -> list[types.Resource]:
     """List available whitelisted Zoho Creator forms and reports as resources."""
+    global _resources_snapshot
     logger.debug("Starting handle_list_resources...")
     
     try:
+        if _resources_snapshot is not None:
+            return list(_resources_snapshot)
+        
         resources = []
         
         # Add container resources
@@ -75,158 +125,245 @@ async def handle_list_resources() -> list[types.Resource]:
                 )
             )
         
-        return resources
+        _resources_snapshot = resources
+        return list(resources)
     
     except Exception as e:
         logger.exception("Error in handle_list_resources")
         raise
 
+async def _handle_forms(
+    uri: AnyUrl, path_parts: Tuple[str, ...], pretty: bool
+) -> types.TextResourceContents:
+    """Read the listing of whitelisted forms."""
+    return types.TextResourceContents(
+        uri=uri,
+        mimeType="application/json",
+        text=_whitelist_json("forms")
+    )
+
+async def _handle_reports(
+    uri: AnyUrl, path_parts: Tuple[str, ...], pretty: bool
+) -> types.TextResourceContents:
+    """Read the listing of whitelisted reports."""
+    return types.TextResourceContents(
+        uri=uri,
+        mimeType="application/json",
+        text=_whitelist_json("reports")
+    )
+
+async def _handle_form(
+    uri: AnyUrl, path_parts: Tuple[str, ...], pretty: bool
+) -> types.TextResourceContents:
+    """Read the records of a whitelisted form, limited to whitelisted fields."""
+    if len(path_parts) < 2:
+        raise ValueError("Missing link name for resource type: form")
+        
+    link_name = path_parts[1]
+    
+    # Check if form is whitelisted
+    form_config = WHITELISTED_RESOURCES["forms"].get(link_name)
+    if not form_config:
+        raise ValueError(f"Form not found or not accessible: {link_name}")
+    
+    # Get form data from Zoho
+    records = await get_service().get_records(link_name)
+    
+    # Filter fields based on whitelist
+    filtered_records = [
+        {
+            field_name: record.data.get(field_name)
+            for field_name in form_config.fields.keys()
+            if field_name in record.data
+        }
+        for record in records
+    ]
+    
+    return types.TextResourceContents(
+        uri=uri,
+        mimeType="application/json",
+        text=orjson.dumps({
+            "form": _config_block("forms", link_name, pretty),
+            "records": filtered_records
+        }, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+    )
+
+async def _handle_report(
+    uri: AnyUrl, path_parts: Tuple[str, ...], pretty: bool
+) -> types.TextResourceContents:
+    """Read the records of a whitelisted report, limited to whitelisted fields."""
+    if len(path_parts) < 2:
+        raise ValueError("Missing link name for resource type: report")
+        
+    link_name = path_parts[1]
+    
+    # Check if report is whitelisted
+    report_config = WHITELISTED_RESOURCES["reports"].get(link_name)
+    if not report_config:
+        raise ValueError(f"Report not found or not accessible: {link_name}")
+    
+    # Get report data from Zoho
+    records = await get_service().get_records(link_name)
+    
+    # Filter fields based on whitelist
+    filtered_records = [
+        {
+            field_name: record.data.get(field_name)
+            for field_name in report_config.fields.keys()
+            if field_name in record.data
+        }
+        for record in records
+    ]
+    
+    return types.TextResourceContents(
+        uri=uri,
+        mimeType="application/json",
+        text=orjson.dumps({
+            "report": _config_block("reports", link_name, pretty),
+            "records": filtered_records
+        }, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+    )
+
+# Resource readers keyed by the first segment of the zoho:// path
+_RESOURCE_HANDLERS: Dict[
+    str, Callable[[AnyUrl, Tuple[str, ...], bool], Awaitable[types.TextResourceContents]]
+] = {
+    "forms": _handle_forms,
+    "reports": _handle_reports,
+    "form": _handle_form,
+    "report": _handle_report,
+}
+
 @server.read_resource()
 async def handle_read_resource(uri: AnyUrl) -> types.TextResourceContents | types.BlobResourceContents:
     """Read data from Zoho Creator based on the resource URI, filtered by whitelist."""
     try:
-        logger.info(f"Reading resource: {uri}")
-        parsed = urlparse(str(uri))
-        
-        if parsed.scheme != "zoho":
-            raise ValueError(f"Unsupported URI scheme: {parsed.scheme}")
+        logger.info("Reading resource: %s", uri)
+        scheme, path_parts, pretty = _parse_zoho_uri(str(uri))
         
-        full_path = f"{parsed.netloc}{parsed.path}".strip("/")
-        path_parts = full_path.split("/")
+        if scheme != "zoho":
+            raise ValueError(f"Unsupported URI scheme: {scheme}")
         
         if not path_parts:
             raise ValueError("Empty resource path")
             
         resource_type = path_parts[0]
-        
-        # Handle root resources
-        if resource_type == "forms":
-            return types.TextResourceContents(
-                uri=uri,
-                mimeType="application/json",
-                text=json.dumps({
-                    "forms": [
-                        {
-                            "link_name": link_name,
-                            "display_name": form.display_name,
-                            "description": form.description,
-                            "fields": {
-                                field_name: field.dict() 
-                                for field_name, field in form.fields.items()
-                            }
-                        }
-                        for link_name, form in WHITELISTED_RESOURCES["forms"].items()
-                    ]
-                }, indent=2)
-            )
-            
-        elif resource_type == "reports":
-            return types.TextResourceContents(
-                uri=uri,
-                mimeType="application/json",
-                text=json.dumps({
-                    "reports": [
-                        {
-                            "link_name": link_name,
-                            "display_name": report.display_name,
-                            "description": report.description,
-                            "fields": {
-                                field_name: field.dict() 
-                                for field_name, field in report.fields.items()
-                            }
-                        }
-                        for link_name, report in WHITELISTED_RESOURCES["reports"].items()
-                    ]
-                }, indent=2)
-            )
-        
-        # Handle specific resources
-        if len(path_parts) < 2:
-            raise ValueError(f"Missing link name for resource type: {resource_type}")
-            
-        link_name = path_parts[1]
-        
-        if resource_type == "form":
-            # Check if form is whitelisted
-            form_config = WHITELISTED_RESOURCES["forms"].get(link_name)
-            if not form_config:
-                raise ValueError(f"Form not found or not accessible: {link_name}")
-            
-            # Get form data from Zoho
-            records = await service.get_records(link_name)
-            
-            # Filter fields based on whitelist
-            filtered_records = [
-                {
-                    field_name: record.data.get(field_name)
-                    for field_name in form_config.fields.keys()
-                    if field_name in record.data
-                }
-                for record in records
-            ]
-            
-            return types.TextResourceContents(
-                uri=uri,
-                mimeType="application/json",
-                text=json.dumps({
-                    "form": {
-                        "link_name": link_name,
-                        "display_name": form_config.display_name,
-                        "description": form_config.description,
-                        "fields": {
-                            name: field.dict() 
-                            for name, field in form_config.fields.items()
-                        }
-                    },
-                    "records": filtered_records
-                }, indent=2)
-            )
-            
-        elif resource_type == "report":
-            # Check if report is whitelisted
-            report_config = WHITELISTED_RESOURCES["reports"].get(link_name)
-            if not report_config:
-                raise ValueError(f"Report not found or not accessible: {link_name}")
-            
-            # Get report data from Zoho
-            records = await service.get_records(link_name)
-            
-            # Filter fields based on whitelist
-            filtered_records = [
-                {
-                    field_name: record.data.get(field_name)
-                    for field_name in report_config.fields.keys()
-                    if field_name in record.data
-                }
-                for record in records
-            ]
-            
-            return types.TextResourceContents(
-                uri=uri,
-                mimeType="application/json",
-                text=json.dumps({
-                    "report": {
-                        "link_name": link_name,
-                        "display_name": report_config.display_name,
-                        "description": report_config.description,
-                        "fields": {
-                            name: field.dict() 
-                            for name, field in report_config.fields.items()
-                        }
-                    },
-                    "records": filtered_records
-                }, indent=2)
-            )
-        
-        else:
+        handler = _RESOURCE_HANDLERS.get(resource_type)
+        if handler is None:
             raise ValueError(f"Unknown resource type: {resource_type}")
+        
+        return await handler(uri, path_parts, pretty)
             
     except Exception as e:
-        logger.exception(f"Error reading resource: {uri}")
+        logger.exception("Error reading resource: %s", uri)
         raise
 
+@server.list_tools()
+async def handle_list_tools() -> list[types.Tool]:
+    """List the tools for writing records to whitelisted Zoho Creator forms."""
+    return [
+        types.Tool(
+            name="create-record",
+            description="Create a record in a Zoho Creator form, using only whitelisted fields",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "form_name": {"type": "string"},
+                    "data": {"type": "object"},
+                },
+                "required": ["form_name", "data"],
+            },
+        ),
+        types.Tool(
+            name="create-records",
+            description="Create several records in a Zoho Creator form in one call, using only whitelisted fields",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "form_name": {"type": "string"},
+                    "records": {"type": "array", "items": {"type": "object"}},
+                },
+                "required": ["form_name", "records"],
+            },
+        ),
+    ]
+
+def _tool_argument(arguments: dict, name: str, adapter: TypeAdapter) -> Any:
+    """Validate a tool argument before anything is sent to Zoho."""
+    if name not in arguments:
+        raise ValueError(f"Missing required argument: {name}")
+    try:
+        return adapter.validate_python(arguments[name], strict=True)
+    except ValidationError as e:
+        raise ValueError(f"Invalid argument '{name}': {e}") from e
+
+def _check_whitelisted_fields(form_config: FormConfig, data: Dict[str, Any]) -> None:
+    """Reject record data that writes fields outside the form's whitelist."""
+    unknown = sorted(set(data) - form_config.fields.keys())
+    if unknown:
+        raise ValueError(
+            f"Fields not accessible in form {form_config.link_name}: {', '.join(unknown)}"
+        )
+
+@server.call_tool()
+async def handle_call_tool(
+    name: str, arguments: dict | None
+) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    """Create records in whitelisted Zoho Creator forms."""
+    if not arguments:
+        raise ValueError("Missing arguments")
+    
+    form_name = _tool_argument(arguments, "form_name", _FORM_NAME_ADAPTER)
+    form_config = WHITELISTED_RESOURCES["forms"].get(form_name)
+    if not form_config:
+        raise ValueError(f"Form not found or not accessible: {form_name}")
+    
+    service = get_service()
+    
+    if name == "create-record":
+        data = _tool_argument(arguments, "data", _RECORD_DATA_ADAPTER)
+        _check_whitelisted_fields(form_config, data)
+        record = await service.create_record(form_name, data)
+        return [
+            types.TextContent(
+                type="text",
+                text=f"Record {record.id} created successfully in {form_name}"
+            )
+        ]
+    
+    elif name == "create-records":
+        data_list = _tool_argument(arguments, "records", _RECORDS_DATA_ADAPTER)
+        for data in data_list:
+            _check_whitelisted_fields(form_config, data)
+        results = await service.create_records(form_name, data_list)
+        created = [result.id for result in results if isinstance(result, ZohoRecord)]
+        failed = [
+            f"#{index}: {result}"
+            for index, result in enumerate(results)
+            if not isinstance(result, ZohoRecord)
+        ]
+        if failed and not created:
+            raise ValueError(f"No records created in {form_name}. Failed: {'; '.join(failed)}")
+        
+        text = f"{len(created)} of {len(results)} records created successfully in {form_name}"
+        if created:
+            text += f": {', '.join(created)}"
+        if failed:
+            text += f". Failed: {'; '.join(failed)}"
+        return [types.TextContent(type="text", text=text)]
+    
+    else:
+        raise ValueError(f"Unknown tool: {name}")
+
 async def main():
     """Main entry point for the server."""
+    # Configure logging to write to a file
+    logging.basicConfig(
+        filename='app.log',  # Specify the log file name
+        filemode='a',        # Append mode
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        level=logging.INFO   # Set the logging level
+    )
     logger.info("Starting Zoho Creator MCP server...")
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
         try:
@@ -248,5 +385,7 @@ async def main():
             raise
         finally:
             logger.info("Shutting down server...")
-            await auth.close()
-            await service.close()
+            if get_service.cache_info().currsize:
+                service = get_service()
+                await service.auth.close()
+                await service.close()
@@ -1,21 +1,32 @@
 # src_scaflog_zoho_mcp_server/service.py
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, TypedDict
+import asyncio
 import httpx
-from datetime import datetime
 import logging
+import orjson
+from pydantic import TypeAdapter
 
 from .models import ZohoForm, ZohoReport, ZohoField, ZohoRecord, Cache
 from .auth import ZohoAuth
 from .config import API_BASE_URL
 
-# Configure logging to write to a file
-logging.basicConfig(
-    filename='app.log',  # Specify the log file name
-    filemode='a',        # Append mode
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    level=logging.INFO   # Set the logging level
-)
+# Upper bound on concurrent requests in the service's fan-out paths: the
+# per-form field fetches in list_forms and the writes in create_records.
+# Single calls such as get_records or create_record are not limited.
+MAX_CONCURRENT_REQUESTS = 10
+
+class RecordsResponse(TypedDict):
+    """Envelope of a Zoho report records response."""
+    data: List[Dict[str, Any]]
+
+class RecordResponse(TypedDict):
+    """Envelope of a Zoho single record response."""
+    data: Dict[str, Any]
+
+# Parse record responses straight from bytes with pydantic-core
+_RECORDS_RESPONSE_ADAPTER = TypeAdapter(RecordsResponse)
+_RECORD_RESPONSE_ADAPTER = TypeAdapter(RecordResponse)
 
 class ZohoCreatorService:
     """Service for interacting with Zoho Creator API."""
@@ -23,8 +34,15 @@ class ZohoCreatorService:
     def __init__(self, auth: ZohoAuth):
         self.auth = auth
         self.cache = Cache()
-        self._client = httpx.AsyncClient(timeout=httpx.Timeout(60.0))
+        # Shared connection pool, kept alive for the lifetime of the service
+        # and torn down in close().
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            http2=True
+        )
         self.base_url = API_BASE_URL[auth.config.environment]
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
     async def list_forms(self, force_refresh: bool = False) -> List[ZohoForm]:
         """Get all available forms."""
@@ -36,14 +54,21 @@ class ZohoCreatorService:
         
         response = await self._client.get(url, headers=headers)
         response.raise_for_status()
-        data = response.json()
-        logging.info(f"Response from list_forms: {data}")  # Log the entire response
+        data = orjson.loads(response.content)
+        logging.info("Response from list_forms: %s", data)  # Log the entire response
+
+        forms_data = data['forms'][:10]
+        # Fetch the fields of every form concurrently instead of one by one
+        fields_list = await asyncio.gather(*(
+            self._get_form_fields(form_data['link_name'], headers)
+            for form_data in forms_data
+        ))
 
+        # Zoho's own responses are trusted, so models are built without validation
         forms = []
-        for form_data in data['forms'][:10]:
-            logging.info(f"Processing form: {form_data['link_name']}")  # Log the link_name
-            fields = await self._get_form_fields(form_data['link_name'], headers)
-            form = ZohoForm(
+        for form_data, fields in zip(forms_data, fields_list):
+            logging.info("Processing form: %s", form_data['link_name'])  # Log the link_name
+            form = ZohoForm.model_construct(
                 link_name=form_data['link_name'],
                 display_name=form_data['display_name'],
                 fields=fields,
@@ -54,17 +79,23 @@ class ZohoCreatorService:
         self.cache.update_forms(forms)
         return forms
 
+    async def get_form_by_name(self, link_name: str) -> Optional[ZohoForm]:
+        """Get a form by link name from the forms cache."""
+        await self.list_forms()  # Served from cache unless the TTL has expired
+        return self.cache.get_form(link_name)
+
     async def _get_form_fields(self, form_link_name: str, headers: dict) -> List[ZohoField]:
         """Get fields for a specific form."""
         url = f"{self.base_url}/form/{form_link_name}/fields"
         
-        response = await self._client.get(url, headers=headers)
+        async with self._semaphore:
+            response = await self._client.get(url, headers=headers)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         # logging.info(f"Response from _get_form_fields: {data}")  # Log the entire response
 
         return [
-            ZohoField(
+            ZohoField.model_construct(
                 link_name=field['link_name'],
                 display_name=field['display_name'],
                 field_type=field['type'],
@@ -79,7 +110,7 @@ class ZohoCreatorService:
 
     async def list_reports(self, force_refresh: bool = False) -> List[ZohoReport]:
         """Get all available reports."""
-        if not force_refresh and not self.cache.needs_refresh():
+        if not force_refresh and not self.cache.needs_reports_refresh():
             return list(self.cache.reports.values())
 
         headers = await self.auth.get_authorized_headers()
@@ -87,13 +118,13 @@ class ZohoCreatorService:
         
         response = await self._client.get(url, headers=headers)
         response.raise_for_status()
-        data = response.json()
-        logging.info(f"Response from list_reports: {data}")  # Log the entire response
+        data = orjson.loads(response.content)
+        logging.info("Response from list_reports: %s", data)  # Log the entire response
 
         reports = []
         for form_data in data['reports'][:10]:
-            logging.info(f"Processing reporrt: {form_data['link_name']}")  # Log the link_name
-            form = ZohoReport(
+            logging.info("Processing report: %s", form_data['link_name'])  # Log the link_name
+            form = ZohoReport.model_construct(
                 link_name=form_data['link_name'],
                 display_name=form_data['display_name'],
                 type=form_data['type']
@@ -103,6 +134,11 @@ class ZohoCreatorService:
         self.cache.update_reports(reports)
         return reports
 
+    async def get_report_by_name(self, link_name: str) -> Optional[ZohoReport]:
+        """Get a report by link name from the reports cache."""
+        await self.list_reports()  # Served from cache unless the TTL has expired
+        return self.cache.get_report(link_name)
+
     async def get_records(
         self,
         report_link_name: str,
@@ -119,19 +155,18 @@ class ZohoCreatorService:
         if limit:
             params['limit'] = limit
 
-        async with self._client as client:
-            response = await client.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            data = response.json()
+        response = await self._client.get(url, headers=headers, params=params)
+        response.raise_for_status()
+        data = _RECORDS_RESPONSE_ADAPTER.validate_json(response.content)
 
-            return [
-                ZohoRecord(
-                    id=record['ID'],
-                    form_link_name=report_link_name,
-                    data=record
-                )
-                for record in data['data']
-            ]
+        return [
+            ZohoRecord.model_construct(
+                id=record['ID'],
+                form_link_name=report_link_name,
+                data=record
+            )
+            for record in data['data']
+        ]
 
     async def get_record(
         self,
@@ -142,16 +177,15 @@ class ZohoCreatorService:
         headers = await self.auth.get_authorized_headers()
         url = f"{self.base_url}/report/{report_link_name}/{record_id}"
         
-        async with self._client as client:
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-            result = response.json()
+        response = await self._client.get(url, headers=headers)
+        response.raise_for_status()
+        result = _RECORD_RESPONSE_ADAPTER.validate_json(response.content)
 
-            return ZohoRecord(
-                id=record_id,
-                form_link_name=report_link_name,
-                data=result['data']
-            )
+        return ZohoRecord.model_construct(
+            id=record_id,
+            form_link_name=report_link_name,
+            data=result['data']
+        )
 
     async def create_record(
         self,
@@ -162,20 +196,38 @@ class ZohoCreatorService:
         headers = await self.auth.get_authorized_headers()
         url = f"{self.base_url}/form/{form_link_name}"
         
-        async with self._client as client:
-            response = await client.post(
-                url,
-                headers=headers,
-                json={"data": data}
-            )
-            response.raise_for_status()
-            result = response.json()
+        response = await self._client.post(
+            url,
+            headers=headers,
+            json={"data": data}
+        )
+        response.raise_for_status()
+        result = orjson.loads(response.content)
 
-            return ZohoRecord(
-                id=result['record']['ID'],
-                form_link_name=form_link_name,
-                data=data
-            )
+        return ZohoRecord(
+            id=result['record']['ID'],
+            form_link_name=form_link_name,
+            data=data
+        )
+
+    async def create_records(
+        self,
+        form_link_name: str,
+        data_list: List[Dict[str, Any]]
+    ) -> List[ZohoRecord | Exception]:
+        """Create several records in a form concurrently.
+
+        A failed write does not stop the others; its exception is returned
+        in place of the record, at the same index as its input.
+        """
+        async def _create(data: Dict[str, Any]) -> ZohoRecord:
+            async with self._semaphore:
+                return await self.create_record(form_link_name, data)
+
+        return await asyncio.gather(
+            *(_create(data) for data in data_list),
+            return_exceptions=True
+        )
 
     async def update_record(
         self,
@@ -187,20 +239,18 @@ class ZohoCreatorService:
         headers = await self.auth.get_authorized_headers()
         url = f"{self.base_url}/report/{report_link_name}/{record_id}"
         
-        async with self._client as client:
-            response = await client.patch(
-                url,
-                headers=headers,
-                json={"data": data}
-            )
-            response.raise_for_status()
-            result = response.json()
+        response = await self._client.patch(
+            url,
+            headers=headers,
+            json={"data": data}
+        )
+        response.raise_for_status()
 
-            return ZohoRecord(
-                id=record_id,
-                form_link_name=report_link_name,
-                data=data
-            )
+        return ZohoRecord(
+            id=record_id,
+            form_link_name=report_link_name,
+            data=data
+        )
 
     async def close(self):
         """Close HTTP client."""
@@ -211,9 +261,10 @@ class ZohoCreatorService:
         try:
             response = await self._client.get("your_api_endpoint")
             response.raise_for_status()  # Raise an error for bad responses
-            logging.info(f"Fetched data: {response.json()}")
-            return response.json()
+            data = orjson.loads(response.content)
+            logging.info("Fetched data: %s", data)
+            return data
         except Exception as e:
-            logging.error(f"Error fetching data: {e}")
+            logging.error("Error fetching data: %s", e)
             return None
         
\ No newline at end of file
@@ -75,11 +75,11 @@ async def client_session(test_env) -> AsyncGenerator[ClientSession, None]:
     
     server_params = StdioServerParameters(
         command=python_path,
-        args=["-m", "src"],
+        args=["-m", "scaflog_zoho_mcp_server"],
         env={
             **os.environ,
             **test_env,
-            "PYTHONPATH": str(project_root)
+            "PYTHONPATH": str(project_root / "src")
         }
     )
 
@@ -80,3 +80,29 @@ async def test_real_server_tools(client_session: ClientSession):
     assert len(result) == 1
     assert result[0].type == "text"
     assert "created successfully" in result[0].text
+
+@pytest.mark.asyncio
+async def test_create_records_rejects_invalid_input(client_session: ClientSession):
+    """Test that malformed tool input is rejected before anything is written."""
+    result = await client_session.call_tool(
+        "create-records",
+        arguments={
+            "form_name": "Company_Info",
+            "records": "notalist"
+        }
+    )
+    assert result.isError
+    assert "Invalid argument 'records'" in result.content[0].text
+
+@pytest.mark.asyncio
+async def test_create_record_rejects_non_whitelisted_fields(client_session: ClientSession):
+    """Test that writes are limited to the form's whitelisted fields."""
+    result = await client_session.call_tool(
+        "create-record",
+        arguments={
+            "form_name": "Company_Info",
+            "data": {"Company_Name": "Test Company", "Owner": "someone"}
+        }
+    )
+    assert result.isError
+    assert "Fields not accessible in form Company_Info: Owner" in result.content[0].text
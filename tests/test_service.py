@@ -1,11 +1,15 @@
 # tests/test_service.py
 import pytest
+import asyncio
 from datetime import datetime
+import httpx
 import logging
 
 # Configure logging for the test
 logging.basicConfig(level=logging.INFO)
 
+from scaflog_zoho_mcp_server.config import ZohoCreatorConfig
+from scaflog_zoho_mcp_server.auth import ZohoAuth
 from scaflog_zoho_mcp_server.service import ZohoCreatorService
 
 @pytest.mark.asyncio
@@ -77,3 +81,60 @@ async def test_fetch_all_records(mock_service: ZohoCreatorService):
         # assert "Company_Info" in record.data  # Ensure the record contains data for the form
 
 # You can add more tests below...
+
+@pytest.mark.asyncio
+async def test_get_form_by_name(mock_service: ZohoCreatorService):
+    """Test looking up a single form through the forms cache."""
+    forms = await mock_service.list_forms(force_refresh=True)
+    assert len(forms) > 0
+
+    form = await mock_service.get_form_by_name(forms[0].link_name)
+    assert form is forms[0]
+    assert await mock_service.get_form_by_name("missing_form") is None
+
+@pytest.mark.asyncio
+async def test_create_records(mock_service: ZohoCreatorService):
+    """Test creating several records concurrently."""
+    records = await mock_service.create_records(
+        "test_form",
+        [{"test_field": "first_value"}, {"test_field": "second_value"}]
+    )
+    assert len(records) == 2
+    assert not any(isinstance(record, Exception) for record in records)
+    assert all(record.form_link_name == "test_form" for record in records)
+    assert [record.data["test_field"] for record in records] == ["first_value", "second_value"]
+
+@pytest.mark.asyncio
+async def test_create_records_refreshes_token_once():
+    """Test that a cold bulk create shares a single OAuth token refresh."""
+    token_requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/oauth/v2/token":
+            token_requests.append(request)
+            await asyncio.sleep(0.01)  # Let the other writes reach the token check
+            return httpx.Response(200, json={"access_token": "token", "expires_in": 3600})
+        return httpx.Response(200, json={"record": {"ID": "123"}})
+
+    config = ZohoCreatorConfig(
+        client_id="client_id",
+        client_secret="client_secret",
+        refresh_token="refresh_token",
+        organization_id="organization_id"
+    )
+    auth = ZohoAuth(config)
+    auth._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    service = ZohoCreatorService(auth)
+    service._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    records = await service.create_records(
+        "test_form",
+        [{"test_field": f"value_{i}"} for i in range(25)]
+    )
+
+    assert len(records) == 25
+    assert not any(isinstance(record, Exception) for record in records)
+    assert len(token_requests) == 1
+
+    await auth.close()
+    await service.close()